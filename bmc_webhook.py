@@ -1,11 +1,13 @@
 # --- Upload support imports (Py 3.13 safe) ---
-import os, uuid, time, pathlib
+import os, time, pathlib
 from typing import Optional, Any, Dict
+from dataclasses import dataclass
 from fastapi import FastAPI, Request, HTTPException, UploadFile, File, Header
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from starlette.staticfiles import StaticFiles
 
 import re, json, logging, traceback, smtplib, ssl
+import requests
 from email.utils import formataddr
 from email.mime.text import MIMEText
 from dotenv import load_dotenv
@@ -16,9 +18,6 @@ load_dotenv()
 
 app = FastAPI(title="AI Villain — BMC Webhook")
 # --- Public share endpoint ----------------------------------------------------
-from fastapi import HTTPException
-import os, requests, time
-
 AIRTABLE_API_KEY = os.getenv("AIRTABLE_API_KEY", "")
 AIRTABLE_BASE_ID = os.getenv("AIRTABLE_BASE_ID", "")
 AIRTABLE_VILLAINS_TABLE = os.getenv("AIRTABLE_VILLAINS_TABLE", "Villains")
@@ -69,7 +68,18 @@ UPLOAD_DIR       = os.getenv("UPLOAD_DIR", "/tmp/uploads")
 BASE_URL         = os.getenv("BASE_URL", "https://ai-villain-bmc-webhook.onrender.com")
 
 pathlib.Path(UPLOAD_DIR).mkdir(parents=True, exist_ok=True)
-app.mount("/static", StaticFiles(directory=UPLOAD_DIR), name="static")
+# YYYY/MM subdirs already created this process (only changes monthly)
+_KNOWN_DIRS: set[str] = set()
+
+# Upload names are random and never rewritten, so browsers/CDNs may cache them forever.
+# In production, let the proxy/CDN serve UPLOAD_DIR at /static so hits never reach ASGI.
+class ImmutableStaticFiles(StaticFiles):
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+app.mount("/static", ImmutableStaticFiles(directory=UPLOAD_DIR), name="static")
 
 # ===== Webhook config =====
 BMC_WEBHOOK_SECRET = os.getenv("BMC_WEBHOOK_SECRET", "")
@@ -100,15 +110,34 @@ SHOP_TITLE_CREDIT_MAP: Dict[str, int] = {
 TITLE_CREDIT_REGEX = os.getenv("BMC_TITLE_CREDIT_REGEX", r"^\s*(\d+)\s*credits?\b")
 
 # ===== helpers =====
+_NUMBER_TYPES = (int, float)
+
 def _pick(obj: dict, keys):
     for k in keys:
         v = obj.get(k)
-        if isinstance(v, str) and v.strip():
-            return v.strip()
-        if isinstance(v, (int, float)):
+        if v.__class__ is str:  # json.loads only yields exact str
+            s = v.strip()
+            if s:
+                return s
+        elif isinstance(v, _NUMBER_TYPES):
             return v
     return None
 
+@dataclass(slots=True)
+class CreditBreakdown:
+    membership: Optional[int] = None
+    membership_name: Optional[str] = None
+    shop: Optional[int] = None
+    shop_title: Optional[str] = None
+    shop_quantity: Optional[int] = None
+    coffees: Optional[int] = None
+    coffees_count: Optional[int] = None
+    credits_per_coffee: Optional[int] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        # only the rules that actually fired, in field order
+        return {k: v for k in self.__slots__ if (v := getattr(self, k)) is not None}
+
 def _from_candidates(payload: Dict[str, Any]):
     return [payload] + ([payload["data"]] if isinstance(payload.get("data"), dict) else [])
 
@@ -191,9 +220,13 @@ def _send_receipt(to_email: str, credited: int):
         server.sendmail(SENDER_EMAIL, [to_email], msg.as_string())
 
 # ===== routes =====
+# pre-serialized: LB probes hit this every few seconds. Fresh Response per call,
+# since FastAPI attaches per-request state (background tasks) to the object.
+_HEALTH_BODY = b'{"ok":true}'
+
 @app.get("/health")
 def health():
-    return {"ok": True}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 @app.post("/webhooks/bmc")
 async def bmc_webhook(request: Request):
@@ -215,7 +248,7 @@ async def bmc_webhook(request: Request):
             raise HTTPException(status_code=422, detail="No email in payload")
 
         total = 0
-        breakdown: Dict[str, int] = {}
+        cb = CreditBreakdown()
 
         membership_name = _extract_membership_name(payload)
         if not membership_name:
@@ -227,8 +260,8 @@ async def bmc_webhook(request: Request):
             mcred = _credits_for_membership(membership_name) or 0
             if mcred > 0:
                 total += mcred
-                breakdown["membership"] = mcred
-                breakdown["membership_name"] = membership_name
+                cb.membership = mcred
+                cb.membership_name = membership_name
 
         title = _extract_shop_title(payload)
         if title and title.lower() not in [k.lower() for k in MEMBERSHIP_CREDIT_MAP.keys()]:
@@ -236,9 +269,9 @@ async def bmc_webhook(request: Request):
             scred = _credits_for_shop(title, qty) or 0
             if scred > 0:
                 total += scred
-                breakdown["shop"] = scred
-                breakdown["shop_title"] = title
-                breakdown["shop_quantity"] = qty
+                cb.shop = scred
+                cb.shop_title = title
+                cb.shop_quantity = qty
 
         coffees = _extract_coffees(payload)
         if coffees == 0 and title and "coffee" in title.lower():
@@ -248,11 +281,12 @@ async def bmc_webhook(request: Request):
             ccred = coffees * CREDITS_PER_COFFEE
             if ccred > 0:
                 total += ccred
-                breakdown["coffees"] = ccred
-                breakdown["coffees_count"] = coffees
-                breakdown["credits_per_coffee"] = CREDITS_PER_COFFEE
+                cb.coffees = ccred
+                cb.coffees_count = coffees
+                cb.credits_per_coffee = CREDITS_PER_COFFEE
 
         if total > 0:
+            breakdown = cb.as_dict()
             add_credits_by_any_email(email, total)
             record_bmc_event("credited_multi", {"payload": payload, "credit_breakdown": breakdown}, total, email=email)
             _send_receipt(email, total)
@@ -304,13 +338,27 @@ async def upload_image(file: UploadFile = File(...), authorization: Optional[str
     now = time.gmtime()
     subdir = f"{now.tm_year}/{now.tm_mon:02d}"
     out_dir = pathlib.Path(UPLOAD_DIR) / subdir
-    out_dir.mkdir(parents=True, exist_ok=True)
+    if subdir not in _KNOWN_DIRS:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(subdir)
 
     ext = _pick_ext(file.filename or "image.png", file.content_type)
-    name = f"{uuid.uuid4().hex}.{ext}"
+    name = f"{os.urandom(16).hex()}.{ext}"
     out_path = out_dir / name
-    with open(out_path, "wb") as f:
-        f.write(data)
+    # raw fd write: skips the buffered IO layer for a single one-shot payload
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(out_path, flags, 0o644)
+    except FileNotFoundError:
+        # /tmp was swept under us; recreate and retry once
+        out_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(out_path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
     url = f"{BASE_URL}/static/{subdir}/{name}"
     return JSONResponse({"ok": True, "url": url})
@@ -318,4 +366,10 @@ async def upload_image(file: UploadFile = File(...), authorization: Optional[str
 if __name__ == "__main__":
     port = int(os.getenv("PORT", "8000"))
     import uvicorn
-    uvicorn.run("bmc_webhook:app", host="0.0.0.0", port=port, reload=True)
+    # cpu_count() reports the host's cores inside containers; each worker is a
+    # full app process, so scale up explicitly via WEB_CONCURRENCY
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    # "auto" picks uvloop + httptools when uvicorn[standard] installed them
+    # (uvloop isn't available on Windows); no reload in prod
+    uvicorn.run("bmc_webhook:app", host="0.0.0.0", port=port,
+                loop="auto", http="auto", workers=workers, reload=False)
@@ -17,8 +17,8 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
-import os, sys, json, random, textwrap, time, re, datetime as _dt
+from typing import Callable, List, Dict, Optional, Tuple
+import os, sys, json, random, textwrap, re, asyncio, weakref, datetime as _dt
 
 import argparse
 from dotenv import load_dotenv
@@ -30,9 +30,14 @@ ROUNDS = int(os.getenv("DUEL_ROUNDS", "10"))
 USE_API = os.getenv("DUEL_USE_OPENAI", "1").strip().lower() in ("1","true","on")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL_NAME", "gpt-4o-mini")
 TEMP = float(os.getenv("DUEL_TEMPERATURE", "0.85"))
+# Echo round/finisher narration to the terminal live while it generates
+STREAM = os.getenv("DUEL_STREAM", "0").strip().lower() in ("1","true","on")
 VIOLENCE_LEVEL = 2  # hard-locked to max gore
 WRAP = 92
 
+# Cap on in-flight OpenAI requests (shared by every duel running in this loop)
+MAX_CONCURRENT_CALLS = int(os.getenv("DUEL_MAX_CONCURRENT_CALLS", "10"))
+
 PRICE_IN_PER_1K = float(os.getenv("PRICE_IN_PER_1K", "0.003"))
 PRICE_OUT_PER_1K = float(os.getenv("PRICE_OUT_PER_1K", "0.006"))
 
@@ -213,6 +218,20 @@ def _round_delta(attacker: Villain, defender: Villain, arena: Arena,
 
 # --------------- OpenAI IO + costs ---------------
 COST_LOG = {"calls": [], "total_input_tokens": 0, "total_output_tokens": 0}
+try:
+    from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+    _RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+except Exception:  # openai missing: _client() reports that before any call is made
+    _RETRYABLE_ERRORS = ()
+_CALL_SEMS = weakref.WeakKeyDictionary()  # event loop -> Semaphore (a semaphore is tied to one loop)
+
+def _call_sem() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    sem = _CALL_SEMS.get(loop)
+    if sem is None:
+        sem = _CALL_SEMS[loop] = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+    return sem
+
 def _client():
     if not USE_API:
         print("[DEBUG] DUEL_USE_OPENAI not enabled.", file=sys.stderr)
@@ -222,38 +241,67 @@ def _client():
         print("[DEBUG] OPENAI_API_KEY not set.", file=sys.stderr)
         sys.exit(1)
     try:
-        from openai import OpenAI
-        return OpenAI(api_key=key)
+        from openai import AsyncOpenAI
+        return AsyncOpenAI(api_key=key)
     except Exception as e:
         print(f"[DEBUG] OpenAI import/init failed: {e}", file=sys.stderr)
         sys.exit(1)
 
-def _retry_call(fn, *args, **kwargs):
-    attempts = 0; last_err = None
-    while attempts < 3:
-        try: return fn(*args, **kwargs)
-        except Exception as e:
-            last_err = e; attempts += 1; 
-            if attempts < 3: time.sleep(0.7 * attempts)
-    raise RuntimeError(str(last_err) if last_err else "Unknown OpenAI error")
-
-def _chat_call(client, messages, max_tokens=500) -> str:
-    def _do():
-        resp = client.chat.completions.create(
-            model=OPENAI_MODEL, messages=messages, temperature=TEMP, max_tokens=max_tokens
-        )
-        try:
-            u = getattr(resp, "usage", None)
-            in_tok  = int(getattr(u, "prompt_tokens", 0) or 0)
-            out_tok = int(getattr(u, "completion_tokens", 0) or 0)
-            COST_LOG["total_input_tokens"]  += in_tok
-            COST_LOG["total_output_tokens"] += out_tok
-            cost = (in_tok/1000.0)*PRICE_IN_PER_1K + (out_tok/1000.0)*PRICE_OUT_PER_1K
-            COST_LOG["calls"].append({"in_tokens": in_tok, "out_tokens": out_tok, "cost_usd": round(cost, 6)})
-        except Exception:
-            pass
-        return (resp.choices[0].message.content or "").strip()
-    return _retry_call(_do)
+async def _retry_call(fn, *args, attempts: int = 5, **kwargs):
+    # Only transient failures (429s, timeouts, dropped connections, 5xx) are
+    # retried, with jittered backoff; auth/bad-request/permission errors won't
+    # succeed on a retry, so they propagate immediately.
+    last_err = None
+    for attempt in range(attempts):
+        try: return await fn(*args, **kwargs)
+        except _RETRYABLE_ERRORS as e:
+            last_err = e
+            if attempt < attempts - 1:
+                await asyncio.sleep(random.uniform(2, 4) * (attempt + 1))
+    raise RuntimeError(str(last_err) if last_err else "Unknown OpenAI error") from last_err
+
+def _log_usage(u) -> None:
+    # single event-loop thread: these COST_LOG updates can't interleave
+    try:
+        in_tok  = int(getattr(u, "prompt_tokens", 0) or 0)
+        out_tok = int(getattr(u, "completion_tokens", 0) or 0)
+        COST_LOG["total_input_tokens"]  += in_tok
+        COST_LOG["total_output_tokens"] += out_tok
+        cost = (in_tok/1000.0)*PRICE_IN_PER_1K + (out_tok/1000.0)*PRICE_OUT_PER_1K
+        COST_LOG["calls"].append({"in_tokens": in_tok, "out_tokens": out_tok, "cost_usd": round(cost, 6)})
+    except Exception:
+        pass
+
+async def _chat_call(client, messages, max_tokens=500, stream=False,
+                     on_delta: Optional[Callable[[str], None]] = None) -> str:
+    # stream=True: text arrives as it is generated (on_delta gets each piece, e.g.
+    # for live terminal output); the full text is still returned for parsing.
+    # A retried stream starts over, so on_delta may see a partial first attempt.
+    async def _do():
+        async with _call_sem():
+            if not stream:
+                resp = await client.chat.completions.create(
+                    model=OPENAI_MODEL, messages=messages, temperature=TEMP, max_tokens=max_tokens
+                )
+                _log_usage(getattr(resp, "usage", None))
+                return (resp.choices[0].message.content or "").strip()
+
+            resp = await client.chat.completions.create(
+                model=OPENAI_MODEL, messages=messages, temperature=TEMP, max_tokens=max_tokens,
+                stream=True, stream_options={"include_usage": True},  # usage arrives in the last chunk
+            )
+            parts = []; usage = None
+            async for chunk in resp:
+                if chunk.choices:
+                    piece = chunk.choices[0].delta.content or ""
+                    if piece:
+                        parts.append(piece)
+                        if on_delta: on_delta(piece)
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+        _log_usage(usage)
+        return "".join(parts).strip()
+    return await _retry_call(_do)
 
 # --------------- System prompts ---------------
 VIOLENCE_TEXT = {
@@ -394,7 +442,7 @@ def _finisher_messages(winner, loser, arena, ledger):
         "winner": {"label": winner.label(), "pronouns":[winner.subj,winner.obj,winner.pos], "powers": winner.powers, "catchphrase": winner.catchphrase},
         "loser":  {"label": loser.label(),  "pronouns":[loser.subj,loser.obj,loser.pos],   "powers": loser.powers},
         "arena": {"name": arena.name, "tags": arena.tags},
-        "ledger": ledger
+        "ledger": {k: v for k, v in ledger.items() if not k.startswith("_")}  # skip internal caches
     }
     return [{"role":"system","content":FINISHER_SYSTEM},
             {"role":"user","content":json.dumps(user, ensure_ascii=False)}]
@@ -445,25 +493,35 @@ def _choose_props_for_round(ledger: dict, max_props: int = 4) -> list:
         if nm and nm not in seen:
             picked.append(it); seen.add(nm)
     ledger["props_in_play"] = [it.get("name") for it in picked if it.get("name")]
+    # lowercased once per round for the continuity parser's prop matching
+    ledger["_props_lc"] = [(nm.lower(), nm) for nm in ledger["props_in_play"]]
     return picked
 
 # --------------- Parse labeled output ---------------
+# Compiled once at import; these run on every round.
+_CAM_RE = re.compile(r'(^|\n)\s*CAMERA:\s*(.+)', re.IGNORECASE)
+_CAM_LINE_RE = re.compile(r'(^|\n)\s*CAMERA:\s*.+(\n|$)', re.IGNORECASE)
+_A_RE = re.compile(r'\bA:\s*(.+?)(?:\n\s*B:|\Z)', re.IGNORECASE|re.DOTALL)
+_B_RE = re.compile(r'\bB:\s*(.+)$', re.IGNORECASE|re.DOTALL)
+_PARA_SPLIT = re.compile(r'\n\s*\n')
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
 def _parse_round_text(txt: str) -> Tuple[str,str,Optional[str]]:
     a_text=b_text=""; camera=None
     t = txt.strip()
-    cam = re.search(r'(^|\n)\s*CAMERA:\s*(.+)', t, flags=re.IGNORECASE)
+    cam = _CAM_RE.search(t)
     if cam:
         camera = "CAMERA: " + cam.group(2).strip()
-        t = re.sub(r'(^|\n)\s*CAMERA:\s*.+(\n|$)', '\n', t, flags=re.IGNORECASE)
-    a_match = re.search(r'\bA:\s*(.+?)(?:\n\s*B:|\Z)', t, flags=re.IGNORECASE|re.DOTALL)
-    b_match = re.search(r'\bB:\s*(.+)$', t, flags=re.IGNORECASE|re.DOTALL)
+        t = _CAM_LINE_RE.sub('\n', t)
+    a_match = _A_RE.search(t)
+    b_match = _B_RE.search(t)
     if a_match: a_text = a_match.group(1).strip()
     if b_match: b_text = b_match.group(1).strip()
     if not a_text or not b_text:
-        paras = [p.strip() for p in re.split(r'\n\s*\n', t) if p.strip()]
+        paras = [p.strip() for p in _PARA_SPLIT.split(t) if p.strip()]
         if len(paras)>=2: a_text=a_text or paras[0]; b_text=b_text or paras[1]
         elif len(paras)==1:
-            s = re.split(r'(?<=[.!?])\s+', paras[0]); mid=max(1,len(s)//2)
+            s = _SENT_SPLIT.split(paras[0]); mid=max(1,len(s)//2)
             a_text=a_text or " ".join(s[:mid]); b_text=b_text or " ".join(s[mid:])
     return a_text.strip(), b_text.strip(), (camera.strip() if camera else None)
 
@@ -474,37 +532,59 @@ STATUS_STUN   = "stunned"
 STATUS_HELD   = "held"     # pinned / restrained / grappled
 
 # --- Phrases we scan for to set status from narration
+# (every scan list below is compiled once at import and matched against the
+#  lowercased panel text)
 STUN_PATTERNS = [
-    r'\b(stunned|dazed|reeling|seeing\s+double|blurry\s+vision|ringing\s+ears|glass[y|ed]\s+eyes)\b',
-    r'\b(concuss|black(?:ed)?\s*out)\b',
+    re.compile(r'\b(stunned|dazed|reeling|seeing\s+double|blurry\s+vision|ringing\s+ears|glass[y|ed]\s+eyes)\b'),
+    re.compile(r'\b(concuss|black(?:ed)?\s*out)\b'),
 ]
 
 HELD_PATTERNS = [
-    r'\b(held\s+down|pinned\s+(to|against)|wrenched\s+into\s+a\s+hold|chokes? (him|her|them)\s+out|armbar|headlock|grappled)\b',
-    r'\b(chain|rope|cable|vine)s?\s+(wraps|coils|tightens)\b',
+    re.compile(r'\b(held\s+down|pinned\s+(to|against)|wrenched\s+into\s+a\s+hold|chokes? (him|her|them)\s+out|armbar|headlock|grappled)\b'),
+    re.compile(r'\b(chain|rope|cable|vine)s?\s+(wraps|coils|tightens)\b'),
 ]
 
+GRAPPLE_WORD_PAT = re.compile(r'\b(grab|grapple|choke|pin|lock|clinch)\b')
+
 # If they break free, we’ll clear held/prone:
 BREAK_FREE_PATTERNS = [
-    r'\b(breaks?\s+free|tears?\s+loose|rips?\s+it\s+off|wrenches?\s+out\s+of\s+the\s+hold|shoves?\s+them\s+off)\b',
+    re.compile(r'\b(breaks?\s+free|tears?\s+loose|rips?\s+it\s+off|wrenches?\s+out\s+of\s+the\s+hold|shoves?\s+them\s+off)\b'),
 ]
 
 
 # --------------- Continuity auto-parser ---------------
 INJURY_PATTERNS = [
-    (r'\b(rib|ribs).*crack', 'cracked ribs'),
-    (r'\bjaw\b.*(break|shatter|crack)', 'broken jaw'),
-    (r'\b(concuss|dazed|blacked out)', 'concussion symptoms'),
-    (r'\b(stab|impal|skewer)', 'stab wound'),
-    (r'\b(bleed|blood|gush|spray)', 'bleeding'),
-    (r'\b(laceration|gash|slash)', 'deep laceration'),
-    (r'\b(dislocat|sprain)', 'dislocation/sprain'),
+    (re.compile(r'\b(rib|ribs).*crack'), 'cracked ribs'),
+    (re.compile(r'\bjaw\b.*(break|shatter|crack)'), 'broken jaw'),
+    (re.compile(r'\b(concuss|dazed|blacked out)'), 'concussion symptoms'),
+    (re.compile(r'\b(stab|impal|skewer)'), 'stab wound'),
+    (re.compile(r'\b(bleed|blood|gush|spray)'), 'bleeding'),
+    (re.compile(r'\b(laceration|gash|slash)'), 'deep laceration'),
+    (re.compile(r'\b(dislocat|sprain)'), 'dislocation/sprain'),
 ]
 KNOCKDOWN_PATTERNS = [
-    r'\b(prone|sprawl|face[- ]?down|on the ground|knocks? .* down)\b',
+    re.compile(r'\b(prone|sprawl|face[- ]?down|on the ground|knocks? .* down)\b'),
 ]
-PROP_PICK_PAT = r'(grabs|snatches|rips|yanks|picks up|wields)\s+(the\s+)?(?P<prop>[\w\s\-]+)'
-PROP_BREAK_PAT = r'(?P<prop>[\w\s\-]+)\s+(shatter|break|snap|splinter)s?'
+PROP_PICK_PAT = re.compile(r'(grabs|snatches|rips|yanks|picks up|wields)\s+(the\s+)?(?P<prop>[\w\s\-]+)')
+# Prop-break detection. Gives the same prop text the old regex
+#   r'(?P<prop>[\w\s\-]+)\s+(shatter|break|snap|splinter)s?'
+# captured via .search, without its backtracking from every start position
+# (quadratic on a long panel). One pass: the first run of [\w\s-] chars holding
+# a verb (with whitespace and >= 1 char before it); the prop is the run up to
+# the space before the *last* such verb, as the greedy group would take.
+_PROP_RUN_PAT = re.compile(r'[\w\s\-]+')
+_BREAK_VERB_PAT = re.compile(r'(?<=\s)(?:shatter|break|snap|splinter)')
+
+def _broken_prop_text(lt: str) -> Optional[str]:
+    for run in _PROP_RUN_PAT.finditer(lt):
+        s = run.group()
+        end = -1
+        for v in _BREAK_VERB_PAT.finditer(s, 2):
+            end = v.start() - 1
+        if end > 0:
+            return s[:end]
+    return None
+
 # Which props can *actually* bind/entangle?
 def _entangle_capable(prop_name: str) -> bool:
     p = (prop_name or "").lower()
@@ -512,10 +592,10 @@ def _entangle_capable(prop_name: str) -> bool:
 
 
 HAZARD_SPAWNERS = [
-    (r'\bglass\b', 'glass shards on floor'),
-    (r'\b(wire|cable).*(sparks?)', 'sparking cables'),
-    (r'\b(slick|slime|oil|blood)\b', 'slick ground'),
-    (r'\bacid|toxin|chemical\b', 'corrosive puddle'),
+    (re.compile(r'\bglass\b'), 'glass shards on floor'),
+    (re.compile(r'\b(wire|cable).*(sparks?)'), 'sparking cables'),
+    (re.compile(r'\b(slick|slime|oil|blood)\b'), 'slick ground'),
+    (re.compile(r'\bacid|toxin|chemical\b'), 'corrosive puddle'),
 ]
 
 def _append_unique(lst: List[str], item: str, max_len: int = 12):
@@ -528,7 +608,9 @@ def _update_continuity_from_panels(a_text: str, b_text: str, ledger: dict, a_lab
     text_map = [(a_label, a_text), (b_label, b_text)]
     injuries = ledger.setdefault("injuries", {a_label:[], b_label:[]})
     hazards = ledger.setdefault("hazards", [])
-    props_in_play = ledger.get("props_in_play", [])
+    props_lc = ledger.get("_props_lc")
+    if props_lc is None:
+        props_lc = [(p.lower(), p) for p in ledger.get("props_in_play", [])]
     destroyed = ledger.setdefault("destroyed_props", [])
     in_hand = ledger.setdefault("in_hand", {a_label:None, b_label:None})
     prop_uses = ledger.setdefault("prop_uses", {})
@@ -543,13 +625,13 @@ def _update_continuity_from_panels(a_text: str, b_text: str, ledger: dict, a_lab
         lt = txt.lower()
 
         for pat, tag in INJURY_PATTERNS:
-            if re.search(pat, lt):
+            if pat.search(lt):
                 if tag not in injuries.setdefault(label, []):
                     injuries[label].append(tag)
                     events.append(f"{label}: injury noted — {tag}")
 
         for pat in KNOCKDOWN_PATTERNS:
-            if re.search(pat, lt):
+            if pat.search(lt):
                 ledger["positional_disadvantage"] = f"{label} is prone and must recover before acting."
                 pos_history[r_idx] = label
                 events.append(f"{label}: knocked prone")
@@ -557,17 +639,17 @@ def _update_continuity_from_panels(a_text: str, b_text: str, ledger: dict, a_lab
         
         # STUNNED?
         for pat in STUN_PATTERNS:
-            if re.search(pat, lt):
+            if pat.search(lt):
                 ledger["status"][label] = STATUS_STUN
                 events.append(f"{label}: stunned")
                 break
 
         # HELD/PINNED?
         for pat in HELD_PATTERNS:
-            if re.search(pat, lt):
+            if pat.search(lt):
                 # Only accept "wrapped/pinned" if they physically have a binder or mention a grapple.
                 binder = in_hand.get(label)
-                has_grapple_word = bool(re.search(r'\b(grab|grapple|choke|pin|lock|clinch)\b', lt))
+                has_grapple_word = bool(GRAPPLE_WORD_PAT.search(lt))
                 if binder and _entangle_capable(binder) or has_grapple_word:
                     ledger["status"][label] = STATUS_HELD
                     events.append(f"{label}: held/pinned")
@@ -578,7 +660,7 @@ def _update_continuity_from_panels(a_text: str, b_text: str, ledger: dict, a_lab
                 break
 
         for pat in BREAK_FREE_PATTERNS:
-            if re.search(pat, lt):
+            if pat.search(lt):
                 if ledger["status"].get(label) in (STATUS_HELD, STATUS_PRONE):
                     ledger["status"][label] = STATUS_NORMAL
                     events.append(f"{label}: breaks free / back to feet")
@@ -588,25 +670,25 @@ def _update_continuity_from_panels(a_text: str, b_text: str, ledger: dict, a_lab
         if any(w in lt for w in ["stagger","reeling","dazed","winded","off-balance","opens","opening","limp","hobble","wobble"]):
             openings[label] = "off-balance; vulnerable next beat"
 
-        pick = re.search(PROP_PICK_PAT, lt)
+        pick = PROP_PICK_PAT.search(lt)
         if pick:
             cand = pick.group('prop').strip().lower()
-            match = next((p for p in props_in_play if cand in p.lower()), None)
+            match = next((orig for lc, orig in props_lc if cand in lc), None)
             if match:
                 in_hand[label] = match
                 prop_uses[match] = prop_uses.get(match,0) + 1
                 events.append(f"{label} picks up: {match}")
 
-        br = re.search(PROP_BREAK_PAT, lt)
+        br = _broken_prop_text(lt)
         if br:
-            cand = br.group('prop').strip().lower()
-            match = next((p for p in props_in_play if cand in p.lower()), None)
+            cand = br.strip().lower()
+            match = next((orig for lc, orig in props_lc if cand in lc), None)
             if match and match not in destroyed:
                 destroyed.append(match)
                 events.append(f"Prop destroyed: {match}")
 
         for pat, hz in HAZARD_SPAWNERS:
-            if re.search(pat, lt):
+            if pat.search(lt):
                 if hz not in hazards:
                     hazards.append(hz)
                     events.append(f"Hazard added: {hz}")
@@ -625,7 +707,15 @@ def _injury_hud_line(ledger: dict, a_label: str, b_label: str) -> str:
     return ""
 
 # --------------- Engine ---------------
-def run_duel(a: Villain, b: Villain, arena: Arena, rounds: int = ROUNDS) -> DuelResult:
+# Visible-recovery checks run on the raw panel text each round
+_RECOVER_PAT = re.compile(r'\b(gets? up|scrambl|push(?:es)? up|clambers|rises)\b', re.IGNORECASE)
+_FREED_PAT = re.compile(r'\b(breaks?\s+free|wrenches?\s+out|tears?\s+loose|shoves?\s+off)\b', re.IGNORECASE)
+_STEADY_PAT = re.compile(r'\b(shakes?\s+it\s+off|blinks?\s+clear|steadies)\b', re.IGNORECASE)
+
+async def run_duel(a: Villain, b: Villain, arena: Arena, rounds: int = ROUNDS,
+                    on_delta: Optional[Callable[[str], None]] = None) -> DuelResult:
+    # on_delta: stream each round's and the finisher's narration as it is generated
+    # (the scene-setter and prop pack run concurrently, so they are not streamed)
     if not USE_API:
         print("[DEBUG] DUEL_USE_OPENAI must be enabled.", file=sys.stderr)
         sys.exit(1)
@@ -648,9 +738,16 @@ def run_duel(a: Villain, b: Villain, arena: Arena, rounds: int = ROUNDS) -> Duel
         "pos_history": {}, # r -> label prone
     }
 
-    scene = _chat_call(client, _scene_setter_messages(a,b,arena), max_tokens=450)
-
-    prop_text = _chat_call(client, _prop_pack_messages(a, b, arena), max_tokens=560)
+    # Scene-setter and prop pack don't depend on each other: fire both at once.
+    # If one fails, cancel the other so it can't keep spending tokens after we raise.
+    scene_task = asyncio.ensure_future(_chat_call(client, _scene_setter_messages(a,b,arena), max_tokens=450))
+    prop_task = asyncio.ensure_future(_chat_call(client, _prop_pack_messages(a, b, arena), max_tokens=560))
+    try:
+        scene, prop_text = await asyncio.gather(scene_task, prop_task)
+    except BaseException:
+        scene_task.cancel(); prop_task.cancel()
+        await asyncio.gather(scene_task, prop_task, return_exceptions=True)  # let the cancel land
+        raise
     ledger["PROP_PACK_RAW"] = prop_text
     ledger["ARENA_SIGNATURE"] = []
     ledger["PROP_CATALOG"] = []
@@ -729,7 +826,7 @@ def run_duel(a: Villain, b: Villain, arena: Arena, rounds: int = ROUNDS) -> Duel
         b_stagger = 1 if (a_delta - b_delta) >= 5 else 0
 
         msgs = _round_messages(a,b,arena,ledger,r,a_total,b_total,rounds,tactic_a,tactic_b)
-        txt = _chat_call(client, msgs, max_tokens=680)
+        txt = await _chat_call(client, msgs, max_tokens=680, stream=on_delta is not None, on_delta=on_delta)
         a_panel, b_panel, camera = _parse_round_text(txt)
 
         _update_continuity_from_panels(a_panel, b_panel, ledger, a.label(), b.label(), r)
@@ -738,23 +835,23 @@ def run_duel(a: Villain, b: Villain, arena: Arena, rounds: int = ROUNDS) -> Duel
         last_prone = ledger.get("pos_history", {}).get(r-1)
         status = ledger.get("status", {})
         # A: enforce recovery text if needed
-        if last_prone == a.label() and not re.search(r'\b(gets? up|scrambl|push(?:es)? up|clambers|rises)\b', a_panel, flags=re.IGNORECASE):
+        if last_prone == a.label() and not _RECOVER_PAT.search(a_panel):
             a_panel = f"{a.label()} scrambles upright, bloodied and snarling, shaking off the knockdown. " + a_panel
             status[a.label()] = STATUS_NORMAL
-        elif status.get(a.label()) == STATUS_HELD and not re.search(r'\b(breaks?\s+free|wrenches?\s+out|tears?\s+loose|shoves?\s+off)\b', a_panel, flags=re.IGNORECASE):
+        elif status.get(a.label()) == STATUS_HELD and not _FREED_PAT.search(a_panel):
             a_panel = f"{a.label()} strains against the restraint, fighting to wrench free. " + a_panel
             # keep HELD if not freed this beat
-        elif status.get(a.label()) == STATUS_STUN and not re.search(r'\b(shakes?\s+it\s+off|blinks?\s+clear|steadies)\b', a_panel, flags=re.IGNORECASE):
+        elif status.get(a.label()) == STATUS_STUN and not _STEADY_PAT.search(a_panel):
             a_panel = f"{a.label()} blinks hard, vision swimming, trying to steady. " + a_panel
             # may remain STUN one more beat
 
         # B: enforce recovery for B
-        if last_prone == b.label() and not re.search(r'\b(gets? up|scrambl|push(?:es)? up|clambers|rises)\b', b_panel, flags=re.IGNORECASE):
+        if last_prone == b.label() and not _RECOVER_PAT.search(b_panel):
             b_panel = f"{b.label()} scrambles upright, bloodied and snarling, shaking off the knockdown. " + b_panel
             status[b.label()] = STATUS_NORMAL
-        elif status.get(b.label()) == STATUS_HELD and not re.search(r'\b(breaks?\s+free|wrenches?\s+out|tears?\s+loose|shoves?\s+off)\b', b_panel, flags=re.IGNORECASE):
+        elif status.get(b.label()) == STATUS_HELD and not _FREED_PAT.search(b_panel):
             b_panel = f"{b.label()} strains against the restraint, fighting to wrench free. " + b_panel
-        elif status.get(b.label()) == STATUS_STUN and not re.search(r'\b(shakes?\s+it\s+off|blinks?\s+clear|steadies)\b', b_panel, flags=re.IGNORECASE):
+        elif status.get(b.label()) == STATUS_STUN and not _STEADY_PAT.search(b_panel):
             b_panel = f"{b.label()} blinks hard, vision swimming, trying to steady. " + b_panel
 
         events = ledger.get("round_events", {}).get(r, [])
@@ -777,7 +874,8 @@ def run_duel(a: Villain, b: Villain, arena: Arena, rounds: int = ROUNDS) -> Duel
             ledger["prop_cooldowns"][k] = max(0, ledger["prop_cooldowns"][k]-1)
 
     winner, loser = (a,b) if a_total>b_total else (b,a) if b_total>a_total else ((a,b) if panels[-1].a_delta>=panels[-1].b_delta else (b,a))
-    finisher = _chat_call(client, _finisher_messages(winner, loser, arena, ledger), max_tokens=420)
+    finisher = await _chat_call(client, _finisher_messages(winner, loser, arena, ledger), max_tokens=420,
+                                stream=on_delta is not None, on_delta=on_delta)
 
     return DuelResult(a=a,b=b,arena=arena,scene_setter=scene,rounds=panels,
                       a_total=a_total,b_total=b_total,winner_label=winner.label(),
@@ -953,7 +1051,8 @@ def default_villains() -> Tuple[Villain, Villain, Arena]:
 
 def main():
     a, b, arena = default_villains()
-    dr = run_duel(a,b,arena, rounds=ROUNDS)
+    live = (lambda t: print(t, end="", flush=True)) if STREAM else None
+    dr = asyncio.run(run_duel(a,b,arena, rounds=ROUNDS, on_delta=live))
     print_duel(dr)
     export_duel_to_docx(dr, DUEL_DOCX_DIR)
 
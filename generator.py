@@ -107,17 +107,17 @@ kk = (os.getenv("OPENAI_API_KEY","") or "").strip()
 try:
     from config import MALE_NAMES, FEMALE_NAMES, NEUTRAL_NAMES, LAST_NAMES
 except Exception:
-    # safe fallbacks
-    MALE_NAMES = ["Alex", "Benjamin", "Carter", "Diego", "Ethan", "Gavin", "Hunter", "Isaac", "Jacob", "Liam"]
-    FEMALE_NAMES = ["Ava", "Bella", "Camila", "Chloe", "Elena", "Emma", "Hannah", "Isabella", "Layla", "Lily"]
-    NEUTRAL_NAMES = ["Avery", "Blair", "Casey", "Charlie", "Dakota", "Eden", "Emery", "Jordan", "Quinn", "Riley"]
-    LAST_NAMES = ["Reed", "Hart", "Lane", "Sloan", "Hayes", "Quinn", "Rivera", "Nguyen", "Khan", "Silva"]
+    # safe fallbacks (tuples: read-only, stored as code constants)
+    MALE_NAMES = ("Alex", "Benjamin", "Carter", "Diego", "Ethan", "Gavin", "Hunter", "Isaac", "Jacob", "Liam")
+    FEMALE_NAMES = ("Ava", "Bella", "Camila", "Chloe", "Elena", "Emma", "Hannah", "Isabella", "Layla", "Lily")
+    NEUTRAL_NAMES = ("Avery", "Blair", "Casey", "Charlie", "Dakota", "Eden", "Emery", "Jordan", "Quinn", "Riley")
+    LAST_NAMES = ("Reed", "Hart", "Lane", "Sloan", "Hayes", "Quinn", "Rivera", "Nguyen", "Khan", "Silva")
 
 # --- small de-dupe so neutral names don't dominate gendered lists
 def _dedup_across_pools():
     neutral_set = {n.lower() for n in NEUTRAL_NAMES}
     def _filter(pool):
-        return [n for n in pool if n and n.strip() and n.lower() not in neutral_set]
+        return tuple(n for n in pool if n and n.strip() and n.lower() not in neutral_set)
     return _filter(MALE_NAMES), _filter(FEMALE_NAMES)
 
 MALE_NAMES, FEMALE_NAMES = _dedup_across_pools()
@@ -125,7 +125,7 @@ MALE_NAMES, FEMALE_NAMES = _dedup_across_pools()
 # ============= Shuffle-bag for non-repeating names =============
 class ShuffleBag:
     def __init__(self, items: List[str]):
-        self.pool: List[str] = list(dict.fromkeys([i.strip() for i in items if i and i.strip()]))
+        self.pool: List[str] = list(dict.fromkeys(i.strip() for i in items if i and i.strip()))
         self.queue: Deque[str] = deque()
         self._reshuffle()
     def _reshuffle(self):
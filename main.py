@@ -337,7 +337,7 @@ def _shim_from_airtable_fields(fields: dict) -> dict | None:
 
     # 2) Normalize power (string → compendium dict)
     p = v.get("power")
-    v["power"] = upconvert_power(p)
+    v["power"] = upconvert_power(p, copy=False)  # v is freshly parsed; ours to mutate
 
     # 3) Normalize theme key (old labels → compendium key; safe pass-through)
     v["theme"] = normalize_style_key(v.get("theme"))